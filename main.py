@@ -1,5 +1,6 @@
 import random
 import numpy as np
+from numba import njit, prange
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from enum import Enum
@@ -11,10 +12,19 @@ class HealthStatus(Enum):
     RECOVERED = 1
     DECEASED = 2
 
+# Plain-int aliases used in hot paths so array comparisons skip Enum machinery
+_HEALTHY = HealthStatus.HEALTHY.value
+_INFECTED = HealthStatus.INFECTED.value
+_RECOVERED = HealthStatus.RECOVERED.value
+_DECEASED = HealthStatus.DECEASED.value
+
 class TransmissionType(Enum):
     AIRBORNE = 1
-    SURFACE = 1
-    BLOOD = 2
+    SURFACE = 2
+    BLOOD = 3
+
+# Iterating an Enum rebuilds the member list; do it once at import
+_TRANSMISSION_TYPES = tuple(TransmissionType)
 
 class Pathogen:
     def __init__(self, name, base_infectivity=0.64, severity=0.26, mutation_rate=0.05):
@@ -30,53 +40,96 @@ class Pathogen:
         }
         self.transmission_vectors = {TransmissionType.AIRBORNE: 0.8}
         self.detection_chance = 0.1
-        
+        self._gene_names = tuple(self.genes)
+        self._rng = np.random.default_rng()
+        self._recompute_derived()
+
     def mutate(self):
-        for gene in self.genes:
-            if random.random() < self.mutation_rate:
-                self.genes[gene] = np.clip(self.genes[gene] + random.uniform(-0.2, 0.2), 0, 1)
-                
-        if random.random() < self.mutation_rate/2:
-            new_vector = random.choice(list(TransmissionType))
+        # One batched coin flip per gene; scalar min/max instead of np.clip
+        flips = self._rng.random(len(self._gene_names)) < self.mutation_rate
+        changed = bool(flips.any())
+        if changed:
+            deltas = self._rng.uniform(-0.2, 0.2, len(self._gene_names))
+            for i, gene in enumerate(self._gene_names):
+                if flips[i]:
+                    self.genes[gene] = min(1.0, max(0.0, self.genes[gene] + deltas[i]))
+
+        if self._rng.random() < self.mutation_rate/2:
+            new_vector = _TRANSMISSION_TYPES[self._rng.integers(len(_TRANSMISSION_TYPES))]
             if new_vector not in self.transmission_vectors:
                 self.transmission_vectors[new_vector] = 0.3
-                
+                changed = True
+
+        if changed:
+            self._recompute_derived()
+
+    def _recompute_derived(self):
+        # Kernel scalars only change when genes/vectors do, so fold them here
+        # instead of recomputing dict lookups every tick
+        self.radius2 = np.float32((1 + self.genes['environmental_stability'] * 3) ** 2)
+        self.effective_infectivity = np.float32(
+            self.base_infectivity * np.mean(list(self.transmission_vectors.values())))
+
     def get_infectivity(self, transmission_type):
         return self.base_infectivity * self.transmission_vectors.get(transmission_type, 0)
 
-class Person:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.health = HealthStatus.HEALTHY
-        self.immunity = 0.00
-        self.infection = None
-        self.symptoms = False
-        self.quarantined = False
-        self.vaccinated = False
-        self.day_infected = 0
-        
-    def update(self, world):
-        if self.health == HealthStatus.INFECTED:
-            if random.random() < self.infection.severity * 0.01:
-                self.health = HealthStatus.DECEASED
-            elif world.day - self.day_infected > 14 + random.randint(-3, 3):
-                self.health = HealthStatus.RECOVERED
-                self.immunity = 0.6
+@njit(parallel=True, fastmath=True, cache=True)
+def _transmit_kernel(ix, iy, infe, sx, sy, susceptibility, cell_start, ncell,
+                     cell_size, radius2, newly):
+    # Loop infected agents in parallel; each one only scans susceptibles in its
+    # own grid cell plus the 8 neighbors (cell_size >= max infection radius).
+    # Susceptible coordinates and 1-immunity arrive pre-gathered in cell order,
+    # so the inner loop reads contiguous float32 and does no indirect loads.
+    # Concurrent True-writes to the same susceptible are benign.
+    for a in prange(ix.size):
+        xi = ix[a]
+        yi = iy[a]
+        cx = min(int(xi / cell_size), ncell - 1)
+        cy = min(int(yi / cell_size), ncell - 1)
+        for gx in range(max(0, cx - 1), min(ncell, cx + 2)):
+            for gy in range(max(0, cy - 1), min(ncell, cy + 2)):
+                c = gx * ncell + gy
+                for b in range(cell_start[c], cell_start[c + 1]):
+                    dx = xi - sx[b]
+                    dy = yi - sy[b]
+                    if dx*dx + dy*dy < radius2:
+                        if np.random.random() < infe * susceptibility[b]:
+                            newly[b] = True
+
+# Warm the JIT at import so the first tick doesn't pay compilation cost
+_transmit_kernel(np.zeros(1, np.float32), np.zeros(1, np.float32), np.float32(0.0),
+                 np.zeros(1, np.float32), np.zeros(1, np.float32), np.zeros(1, np.float32),
+                 np.array([0, 1], dtype=np.int64), 1, np.float32(4.0),
+                 np.float32(0.0), np.zeros(1, np.bool_))
 
 class World:
-    def __init__(self, size=100, population=500):
+    def __init__(self, size=100, population=500, seed=None):
         self.size = size
-        self.population = [Person(random.uniform(0, size), random.uniform(0, size)) for _ in range(population)]
+        self.n = population
+        self.rng = np.random.default_rng(seed)
+        # Structure-of-arrays population state: one contiguous array per field
+        self.x = self.rng.uniform(0, size, population).astype(np.float32)
+        self.y = self.rng.uniform(0, size, population).astype(np.float32)
+        self.health = np.full(population, _HEALTHY, dtype=np.int8)
+        self.immunity = np.zeros(population, dtype=np.float32)
+        self.day_infected = np.zeros(population, dtype=np.int16)
+        self.quarantined = np.zeros(population, dtype=bool)
+        self.vaccinated = np.zeros(population, dtype=bool)
+        self.symptoms = np.zeros(population, dtype=bool)
         self.day = 0
         self.travel_rate = 0.09
         self.medical_capacity = 0.1
         self.quarantine_effectiveness = 0.0
         self.vaccination_rate = 0.0
         self.current_outbreak = None
+        # Uniform spatial grid for neighbor queries; the infection radius is
+        # 1 + environmental_stability*3 <= 4, so one cell always covers it
+        self._cell_size = 4.0
+        self._ncell = max(1, int(np.ceil(size / self._cell_size)))
         self.cities = []
         self.init_cities()
-        
+        self._recount()
+
     def init_cities(self):
         for _ in range(5):
             self.cities.append({
@@ -84,59 +137,90 @@ class World:
                 'population_density': random.uniform(0.1, 0.9),
                 'travel_restrictions': False
             })
-            
+
     def spread_pathogen(self, pathogen):
         if not self.current_outbreak:
             self.current_outbreak = pathogen
-            patient_zero = random.choice(self.population)
-            patient_zero.health = HealthStatus.INFECTED
-            patient_zero.infection = pathogen
-            patient_zero.day_infected = self.day
-            
+            patient_zero = int(self.rng.integers(self.n))
+            self.health[patient_zero] = _INFECTED
+            self.day_infected[patient_zero] = self.day
+
+    def _build_grid(self, idx):
+        # CSR-style cell index over the given agents: sorted ids + per-cell offsets
+        ncell = self._ncell
+        cx = np.minimum((self.x[idx] / self._cell_size).astype(np.int32), ncell - 1)
+        cy = np.minimum((self.y[idx] / self._cell_size).astype(np.int32), ncell - 1)
+        cell = cx * ncell + cy
+        order = np.argsort(cell, kind='stable')
+        cell_start = np.searchsorted(cell[order], np.arange(ncell * ncell + 1))
+        return idx[order], cell_start
+
+    def _recount(self):
+        # One pass over health gives every status count (INFECTED=10 sets the length)
+        self._counts = np.bincount(self.health, minlength=_INFECTED + 1)
+        return self._counts
+
     def update(self):
         self.day += 1
+        self._recount()
         self.apply_public_health_measures()
         self.simulate_travel()
-        
-        infected = [p for p in self.population if p.health == HealthStatus.INFECTED and not p.quarantined]
-        for person in infected:
-            for other in self.population:
-                if other.health == HealthStatus.HEALTHY and not other.vaccinated:
-                    distance = np.sqrt((person.x - other.x)**2 + (person.y - other.y)**2)
-                    transmission_type = random.choice(list(person.infection.transmission_vectors.keys()))
-                    infectivity = person.infection.get_infectivity(transmission_type)
-                    
-                    if distance < 1 + person.infection.genes['environmental_stability'] * 3:
-                        if random.random() < infectivity * (1 - other.immunity):
-                            other.health = HealthStatus.INFECTED
-                            other.infection = person.infection
-                            other.day_infected = self.day
-                            other.symptoms = random.random() < person.infection.genes['asymptomatic_spread']
-
-        for person in self.population:
-            person.update(self)
-            
+
+        pathogen = self.current_outbreak
+        # Shared per-tick counts let burned-out ticks skip the index scans too
+        if self._counts[_INFECTED] == 0 or self._counts[_HEALTHY] == 0:
+            inf_idx = sus_idx = np.empty(0, dtype=np.int64)
+        else:
+            inf_idx = np.where((self.health == _INFECTED) & ~self.quarantined)[0]
+            sus_idx = np.where((self.health == _HEALTHY) & ~self.vaccinated)[0]
+        if inf_idx.size and sus_idx.size:
+            # Gather per-side invariants once, outside the pair loop; the squared
+            # radius and vector-averaged infectivity come precomputed from the
+            # pathogen, so no dict lookups remain on the hot path
+            sus_sorted, cell_start = self._build_grid(sus_idx)
+            susceptibility = 1.0 - self.immunity[sus_sorted]
+            newly_mask = np.zeros(sus_idx.size, dtype=np.bool_)
+            _transmit_kernel(self.x[inf_idx], self.y[inf_idx], pathogen.effective_infectivity,
+                             self.x[sus_sorted], self.y[sus_sorted], susceptibility,
+                             cell_start, self._ncell, np.float32(self._cell_size),
+                             pathogen.radius2, newly_mask)
+            newly = sus_sorted[newly_mask]
+            self.health[newly] = _INFECTED
+            self.day_infected[newly] = self.day
+            self.symptoms[newly] = self.rng.random(newly.size) < pathogen.genes['asymptomatic_spread']
+
+        self._progress_disease()
+
         self.current_outbreak.mutate()
-        
+
+    def _progress_disease(self):
+        pathogen = self.current_outbreak
+        inf_mask = self.health == _INFECTED
+        deaths = inf_mask & (self.rng.random(self.n) < pathogen.severity * 0.01)
+        jitter = self.rng.integers(-3, 4, self.n)
+        recoveries = inf_mask & ~deaths & (self.day - self.day_infected > 14 + jitter)
+        self.health[deaths] = _DECEASED
+        self.health[recoveries] = _RECOVERED
+        self.immunity[recoveries] = 0.6
+
     def apply_public_health_measures(self):
-        infection_rate = len([p for p in self.population if p.health == HealthStatus.INFECTED])/len(self.population) * 1.05
+        infection_rate = self._counts[_INFECTED]/self.n * 1.05
         if infection_rate > 0.03:
             self.quarantine_effectiveness = min(0.5, self.quarantine_effectiveness + 0.02)
         if infection_rate > 0.1:
             self.vaccination_rate = min(0.3, self.vaccination_rate + 0.01)
-            
-        for person in self.population:
-            if person.symptoms and random.random() < self.quarantine_effectiveness:
-                person.quarantined = True
-            if random.random() < self.vaccination_rate/250:
-                person.vaccinated = True
-                
+
+        # One batched draw per measure instead of a random.random() per person
+        self.quarantined |= self.symptoms & (self.rng.random(self.n) < self.quarantine_effectiveness)
+        self.vaccinated |= self.rng.random(self.n) < self.vaccination_rate/250
+
     def simulate_travel(self):
-        for person in self.population:
-            if random.random() < self.travel_rate:
-                target_city = random.choice(self.cities)
-                person.x = np.clip(person.x + random.uniform(-5,5), 0, self.size)
-                person.y = np.clip(person.y + random.uniform(-5,5), 0, self.size)
+        moves = self.rng.random(self.n) < self.travel_rate
+        deltas = self.rng.uniform(-5, 5, (self.n, 2)).astype(np.float32)
+        # Clip straight back into the coordinate arrays; masked-out agents get
+        # a zero delta, so no fancy-indexed gather/scatter temporaries
+        np.clip(self.x + np.where(moves, deltas[:, 0], 0), 0, self.size, out=self.x)
+        np.clip(self.y + np.where(moves, deltas[:, 1], 0), 0, self.size, out=self.y)
 
 # ... (keep all previous code the same until VirusGame class)
 
@@ -166,20 +250,39 @@ class VirusGame:
         ]
         self.current_fact = ""
         self.fact_duration = 0
+        self.steps_per_frame = 4  # sim ticks per rendered frame
 
     def setup_plots(self):
         # World Map
         self.ax1.set_title("Disease Spread Simulation", fontsize=14, color='cyan')
         self.ax1.set_xticks([])
         self.ax1.set_yticks([])
-        
+        self.ax1.set_xlim(0, self.world.size)
+        self.ax1.set_ylim(0, self.world.size)
+        # Day counter lives inside the axes so blitting repaints it (the axes
+        # title sits outside ax1.bbox and would never visually update)
+        self._day_label = self.ax1.text(0.02, 0.98, "", transform=self.ax1.transAxes,
+                                        fontsize=12, color='cyan', va='top')
+
+        # RGBA lookup table indexed by the int8 health value
+        self._color_lut = np.zeros((_INFECTED + 1, 4))
+        self._color_lut[_HEALTHY] = (0.12, 0.47, 0.71, 0.6)    # Blue
+        self._color_lut[_INFECTED] = (1.0, 0.5, 0.05, 0.6)     # Orange
+        self._color_lut[_RECOVERED] = (0.17, 0.63, 0.17, 0.6)  # Green
+        self._color_lut[_DECEASED] = (0.84, 0.15, 0.16, 0.6)   # Red
+        self._scatter = self.ax1.scatter(self.world.x, self.world.y, s=15,
+                                         marker='o', edgecolors='w', linewidths=0.3)
+
         # Infection Spread Graph
         self.ax2.set_title("Population Health Status Over Time", fontsize=12)
         self.ax2.set_xlabel("Days Since First Infection", fontsize=10)
         self.ax2.set_ylabel("% of Population", fontsize=10)
         self.ax2.set_facecolor('#0a0a0a')
         self.ax2.grid(True, alpha=0.3)
-        
+        self._xmax = 10
+        self.ax2.set_xlim(0, self._xmax)
+        self.ax2.set_ylim(0, 100)
+
         self.lines = {
             'healthy': self.ax2.plot([], [], label='Healthy', color='#1f77b4', lw=2)[0],
             'infected': self.ax2.plot([], [], label='Infected', color='#ff7f0e', lw=2)[0],
@@ -187,65 +290,69 @@ class VirusGame:
             'deceased': self.ax2.plot([], [], label='Deceased', color='#d62728', lw=2)[0]
         }
         self.ax2.legend(loc='upper left', facecolor='#121212')
-        
+
         # Stats Panel
         self.ax3.set_facecolor('#0a0a0a')
         self.ax3.axis('off')
-        self.stats_text = self.ax3.text(0.05, 0.95, "", transform=self.ax3.transAxes, 
+        self.stats_text = self.ax3.text(0.05, 0.95, "", transform=self.ax3.transAxes,
                                        fontsize=9, color='white', va='top')
-        
-        # Educational Fact
-        self.fact_text = self.fig.text(0.5, 0.01, "", ha='center', va='bottom', 
-                                     color='yellow', fontsize=10, wrap=True)
-        
-        self.history = {k: [] for k in ['days', 'healthy', 'infected', 'recovered', 'deceased']}
+
+        # Educational Fact; anchored inside ax1 rather than on the figure, since
+        # figure-level text has no axes and breaks Animation._blit_draw
+        self.fact_text = self.ax1.text(0.5, 0.02, "", transform=self.ax1.transAxes,
+                                       ha='center', va='bottom', color='yellow',
+                                       fontsize=10, wrap=True)
+
+        # Preallocated history buffers with a write cursor; grown if the cap is hit
+        self._hist_cap = 4096
+        self._hist = {k: np.empty(self._hist_cap, dtype=np.float32)
+                      for k in ['days', 'healthy', 'infected', 'recovered', 'deceased']}
+        self._hist_len = 0
 
     def update_plot(self, frame):
-        self.world.update()
-        self.update_history()
+        # Run several ticks per redraw so the sim isn't capped by the
+        # animation interval; only the last state gets rendered
+        for _ in range(self.steps_per_frame):
+            self.world.update()
+            self.update_history()
         self.update_scatter()
         self.update_graph()
         self.update_stats()
         self.update_facts()
-        return [self.lines[k] for k in self.lines]
+        # Blitting needs every mutated artist back
+        return [self._scatter, self._day_label, self.stats_text, self.fact_text] + \
+               [self.lines[k] for k in self.lines]
 
     def update_history(self):
-        total = len(self.world.population)
-        self.history['days'].append(self.world.day)
-        self.history['healthy'].append(len([p for p in self.world.population 
-                                           if p.health == HealthStatus.HEALTHY])/total*100)
-        self.history['infected'].append(len([p for p in self.world.population 
-                                           if p.health == HealthStatus.INFECTED])/total*100)
-        self.history['recovered'].append(len([p for p in self.world.population 
-                                            if p.health == HealthStatus.RECOVERED])/total*100)
-        self.history['deceased'].append(len([p for p in self.world.population 
-                                           if p.health == HealthStatus.DECEASED])/total*100)
+        pct = self.world._recount() * (100.0/self.world.n)
+        if self._hist_len == self._hist_cap:
+            self._hist_cap *= 2
+            for k in self._hist:
+                self._hist[k] = np.resize(self._hist[k], self._hist_cap)
+        i = self._hist_len
+        self._hist['days'][i] = self.world.day
+        self._hist['healthy'][i] = pct[_HEALTHY]
+        self._hist['infected'][i] = pct[_INFECTED]
+        self._hist['recovered'][i] = pct[_RECOVERED]
+        self._hist['deceased'][i] = pct[_DECEASED]
+        self._hist_len = i + 1
 
     def update_scatter(self):
-        colors = []
-        for p in self.world.population:
-            if p.health == HealthStatus.HEALTHY:
-                colors.append('#1f77b4')  # Blue
-            elif p.health == HealthStatus.INFECTED:
-                colors.append('#ff7f0e')  # Orange
-            elif p.health == HealthStatus.RECOVERED:
-                colors.append('#2ca02c')  # Green
-            else:
-                colors.append('#d62728')  # Red
-                
-        self.ax1.clear()
-        self.ax1.scatter([p.x for p in self.world.population], [p.y for p in self.world.population],
-                        c=colors, s=15, alpha=0.6, marker='o', edgecolors='w', linewidths=0.3)
-        self.ax1.set_title(f"Day {self.world.day} - {self.virus.name}", color='cyan')
+        self._scatter.set_offsets(np.column_stack([self.world.x, self.world.y]))
+        self._scatter.set_facecolors(self._color_lut[self.world.health])
+        self._day_label.set_text(f"Day {self.world.day} - {self.virus.name}")
 
     def update_graph(self):
+        days = self._hist['days'][:self._hist_len]
         for status in ['healthy', 'infected', 'recovered', 'deceased']:
-            self.lines[status].set_data(self.history['days'], self.history[status])
-        
-        self.ax2.set_xlim(0, max(10, self.world.day))
-        self.ax2.set_ylim(0, 100)
-        self.ax2.relim()
-        self.ax2.autoscale_view(scalex=False, scaley=False)
+            self.lines[status].set_data(days, self._hist[status][:self._hist_len])
+
+        # Grow the x axis in doubling steps; each change needs one full draw so
+        # the blit background is re-cached with the new tick labels
+        if self.world.day > self._xmax:
+            self._xmax = max(self._xmax * 2, self.world.day)
+            self.ax2.set_xlim(0, self._xmax)
+            self.fig.canvas.draw()
 
     def update_stats(self):
         stats = [
@@ -268,21 +375,20 @@ class VirusGame:
             self.fact_duration = 5  # Show for 5 frames
         else:
             self.fact_duration -= 1
-            
+
         self.fact_text.set_text(self.current_fact)
 
     def calculate_r0(self):
-        if len(self.history['infected']) < 2:
-            return 0.0
-        try:
-            growth = np.diff(self.history['infected'])
-            return np.mean(growth[-5:])/10  # Simplified approximation
-        except:
+        if self._hist_len < 6:
             return 0.0
+        # Only the last 5 growth deltas matter; slice before diffing
+        last = self._hist['infected'][self._hist_len - 6:self._hist_len]
+        return float(np.diff(last).mean()/10)  # Simplified approximation
 
     def start_simulation(self):
         self.world.spread_pathogen(self.virus)
-        ani = FuncAnimation(self.fig, self.update_plot, interval=100, cache_frame_data=False)
+        ani = FuncAnimation(self.fig, self.update_plot, interval=100, blit=True,
+                            cache_frame_data=False)
         plt.subplots_adjust(left=0.05, right=0.95, bottom=0.15, top=0.9, wspace=0.3, hspace=0.4)
         plt.show()
 